@@ -4,37 +4,62 @@ Package for the application models and service routes
 This module creates and configures the Flask app and sets up the logging
 and SQL database
 """
+import importlib
+import os
 import sys
 from flask import Flask
 from service import config
 from service.common import log_handlers
 
+
+# Modules that register models, routes, error handlers and CLI commands
+_MODULES = (
+    "service.models",
+    "service.routes",
+    "service.common.error_handlers",
+    "service.common.cli_commands",
+)
+
+
+def _load_modules():
+    """Imports the service modules and returns service.models"""
+    for name in _MODULES:
+        importlib.import_module(name)
+    return sys.modules["service.models"]
+
+
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
 
-# Import the routes After the Flask app is created
-# pylint: disable=wrong-import-position, cyclic-import, wrong-import-order
-from service import routes, models  # noqa: F401 E402
+# Set SERVICE_LAZY to skip these imports when the package is imported;
+# _bootstrap() loads them before the app is served
+if not os.getenv("SERVICE_LAZY"):
+    # Import the routes After the Flask app is created
+    _load_modules()
 
-# pylint: disable=wrong-import-position
-from service.common import error_handlers, cli_commands  # noqa: F401 E402
 
-# Set up logging for production
-log_handlers.init_logging(app, "gunicorn.error")
+def _bootstrap():
+    """Sets up logging and the database for the production app"""
+    models = _load_modules()
 
-app.logger.info(70 * "*")
-app.logger.info("  A C C O U N T   S E R V I C E   R U N N I N G  ".center(70, "*"))
-app.logger.info(70 * "*")
+    # Set up logging for production
+    log_handlers.init_logging(app, "gunicorn.error")
+
+    app.logger.info(70 * "*")
+    app.logger.info("  A C C O U N T   S E R V I C E   R U N N I N G  ".center(70, "*"))
+    app.logger.info(70 * "*")
+
+    try:
+        models.init_db(app)  # make our database tables
+    except Exception as error:  # pylint: disable=broad-except
+        app.logger.critical("%s: Cannot continue", error)
+        # gunicorn requires exit code 4 to stop spawning workers when they die
+        sys.exit(4)
 
-try:
-    models.init_db(app)  # make our database tables
-except Exception as error:  # pylint: disable=broad-except
-    app.logger.critical("%s: Cannot continue", error)
-    # gunicorn requires exit code 4 to stop spawning workers when they die
-    sys.exit(4)
+    app.logger.info("Service initialized!")
+    return app
 
-app.logger.info("Service initialized!")
 
 # ----------------------------------------------------------------------
 # App factory for testing and reuse
@@ -44,9 +69,8 @@ def create_app():
     flask_app = Flask(__name__)
     flask_app.config.from_object(config)
 
-    # Re-imports for route setup
-    from service import routes, models
-    from service.common import error_handlers, cli_commands
+    # Deferred imports for route setup
+    models = _load_modules()
 
     log_handlers.init_logging(flask_app, "gunicorn.error")
 
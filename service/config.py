@@ -19,5 +19,20 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# DB_POOL_SIZE sets how many connections each Gunicorn worker keeps open
+# (default 5, plus up to 10 overflow connections under load). Only
+# PostgreSQL uses a QueuePool; SQLite's pools reject these options
+if DATABASE_URI.startswith("postgresql"):
+    SQLALCHEMY_ENGINE_OPTIONS.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=10,
+        pool_use_lifo=True,
+    )
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
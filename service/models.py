@@ -11,7 +11,16 @@ from flask_sqlalchemy import SQLAlchemy
 logger = logging.getLogger("flask.app")
 
 # Create the SQLAlchemy object to be initialized later in init_db()
-db = SQLAlchemy()
+# Objects keep their loaded state after commit so serialize() does not
+# need another SELECT to refresh them
+db = SQLAlchemy(session_options={"expire_on_commit": False})
+
+# Bound once so deserialize() avoids the attribute lookups on every call
+_from_iso = date.fromisoformat
+_today = date.today
+
+# Fields that must be present when deserializing an Account
+_REQUIRED_FIELDS = ("name", "email", "address")
 
 
 class DataValidationError(Exception):
@@ -31,28 +40,42 @@ class PersistentBase:
 
     def create(self):
         """Creates a record in the database"""
-        logger.info("Creating %s", str(self))
+        logger.info("Creating %s", self)
         db.session.add(self)
         db.session.commit()
 
     def update(self):
         """Updates a record in the database"""
-        logger.info("Updating %s", str(self))
+        logger.info("Updating %s", self)
         db.session.commit()
 
     def delete(self):
         """Deletes a record from the database"""
-        logger.info("Deleting %s", str(self))
+        logger.info("Deleting %s", self)
         db.session.delete(self)
         db.session.commit()
 
+    @classmethod
+    def create_many(cls, instances):
+        """Creates a batch of records in the database with a single commit"""
+        logger.info("Creating %s records", len(instances))
+        db.session.bulk_save_objects(instances)
+        db.session.commit()
+
+    @classmethod
+    def bulk_create(cls, records):
+        """Inserts a list of dictionaries with a single executemany INSERT"""
+        logger.info("Bulk inserting %s records", len(records))
+        db.session.execute(db.insert(cls), records)
+        db.session.commit()
+
     @classmethod
     def init_db(cls, app):
         """Initializes the database session"""
         logger.info("Initializing database")
         db.init_app(app)
-        app.app_context().push()
-        db.create_all()
+        with app.app_context():
+            db.create_all()
 
     @classmethod
     def all(cls):
@@ -64,7 +87,7 @@ class PersistentBase:
     def find(cls, by_id):
         """Finds a record by ID"""
         logger.info("Finding record with id: %s", by_id)
-        return cls.query.get(by_id)
+        return db.session.get(cls, by_id)
 
 
 ######################################################################
@@ -75,7 +98,7 @@ class Account(db.Model, PersistentBase):
 
     # Table Schema
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(64), nullable=False)
+    name = db.Column(db.String(64), nullable=False, index=True)
     email = db.Column(db.String(64), nullable=False)
     address = db.Column(db.String(256), nullable=False)
     phone_number = db.Column(db.String(32), nullable=True)
@@ -86,13 +109,14 @@ class Account(db.Model, PersistentBase):
 
     def serialize(self):
         """Serializes an Account into a dictionary"""
+        date_joined = self.date_joined
         return {
             "id": self.id,
             "name": self.name,
             "email": self.email,
             "address": self.address,
             "phone_number": self.phone_number,
-            "date_joined": self.date_joined.isoformat() if self.date_joined else None,
+            "date_joined": date_joined.isoformat() if date_joined else None,
         }
 
     def deserialize(self, data):
@@ -102,15 +126,21 @@ class Account(db.Model, PersistentBase):
         Args:
             data (dict): A dictionary containing the resource data
         """
+        if not isinstance(data, dict):
+            raise DataValidationError(
+                "Invalid Account: body of request contained bad or no data - "
+                + type(data).__name__
+            )
+        missing = next((key for key in _REQUIRED_FIELDS if key not in data), None)
+        if missing:
+            raise DataValidationError("Invalid Account: missing " + missing)
+        self.name = data["name"]
+        self.email = data["email"]
+        self.address = data["address"]
+        self.phone_number = data.get("phone_number")
+        date_joined = data.get("date_joined")
         try:
-            self.name = data["name"]
-            self.email = data["email"]
-            self.address = data["address"]
-            self.phone_number = data.get("phone_number")
-            date_joined = data.get("date_joined")
-            self.date_joined = date.fromisoformat(date_joined) if date_joined else date.today()
-        except KeyError as error:
-            raise DataValidationError("Invalid Account: missing " + error.args[0]) from error
+            self.date_joined = _from_iso(date_joined) if date_joined else _today()
         except TypeError as error:
             raise DataValidationError(
                 "Invalid Account: body of request contained bad or no data - " + str(error)
@@ -0,0 +1,81 @@
+"""
+Test cases for the service package and WSGI entry point
+"""
+import os
+import sys
+import importlib
+import subprocess
+from unittest import TestCase
+from unittest.mock import patch
+from service import app, _bootstrap
+from service.common import status  # HTTP Status Codes
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints whether importing the package pulled in the routes
+CHECK_IMPORTS = (
+    "import sys, service; "
+    "print('service.routes' in sys.modules, sorted(service.app.view_functions))"
+)
+
+
+######################################################################
+#  S E R V I C E   P A C K A G E   T E S T   C A S E S
+######################################################################
+class TestServicePackage(TestCase):
+    """Test Cases for importing the service package"""
+
+    def _import_service(self, **environ):
+        """Imports the service package in a fresh interpreter"""
+        env = {key: value for key, value in os.environ.items() if key != "SERVICE_LAZY"}
+        env.update(environ)
+        result = subprocess.run(
+            [sys.executable, "-c", CHECK_IMPORTS],
+            cwd=ROOT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    def test_import_registers_routes(self):
+        """It should register the routes when the package is imported"""
+        output = self._import_service()
+        self.assertTrue(output.startswith("True"))
+        self.assertIn("'health'", output)
+
+    def test_service_lazy_skips_imports(self):
+        """It should not import the routes when SERVICE_LAZY is set"""
+        output = self._import_service(SERVICE_LAZY="1")
+        self.assertEqual(output, "False ['static']")
+
+
+######################################################################
+#  W S G I   E N T R Y   P O I N T   T E S T   C A S E S
+######################################################################
+class TestWsgi(TestCase):
+    """Test Cases for the WSGI entry point"""
+
+    def setUp(self):
+        """Runs before each test"""
+        # _bootstrap() installs the production logging on the shared app
+        logger = app.logger
+        self.addCleanup(setattr, logger, "handlers", logger.handlers)
+        self.addCleanup(setattr, logger, "propagate", logger.propagate)
+        self.addCleanup(logger.setLevel, logger.level)
+
+    def test_wsgi_serves_health(self):
+        """It should serve the health endpoint from the wsgi app"""
+        wsgi = importlib.import_module("wsgi")
+        resp = wsgi.app.test_client().get("/health")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.get_json()["status"], "OK")
+
+    @patch("service.models.init_db", side_effect=Exception("no database"))
+    def test_bootstrap_exits_without_database(self, init_db_mock):
+        """It should exit with code 4 when the database cannot be set up"""
+        with self.assertRaises(SystemExit) as context:
+            _bootstrap()
+        self.assertEqual(context.exception.code, 4)
+        init_db_mock.assert_called_once_with(app)
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for the Account Service
+
+Sets up logging and the database before serving requests:
+  gunicorn wsgi:app
+"""
+from service import _bootstrap
+
+app = _bootstrap()